@@ -4,19 +4,25 @@ Reliqua Framework.
 Copyright 2016-2024.
 """
 
+from itertools import count
+
 from reliqua.resources.base import Resource
 from reliqua.status_codes import HTTP
 
-users = [
-    {
+# users keyed by id
+users = {
+    0: {
         "username": "ted",
         "email": "ted@nowhere.com",
     },
-    {
+    1: {
         "username": "bob",
         "email": "bob@nowhere.com",
     },
-]
+}
+
+# ids are not reused after a delete
+user_ids = count(len(users))
 
 phones = ["603-555-1234", "603-555-5678"]
 
@@ -58,10 +64,13 @@ class User(Resource):
         :accepts [json,xml]:   Accept types
         :return [json,xml]:    Return content type
         """
-        try:
-            resp.media = users[int(id)]
-        except IndexError:
+        user = users.get(int(id)) if id.isdecimal() else None
+
+        if user is None:
             resp.status = HTTP("404")
+            return
+
+        resp.media = user
 
     def on_delete_by_id(self, _req, resp, id=None):
         """
@@ -71,11 +80,14 @@ class User(Resource):
 
         :return json:
         """
-        try:
-            users.pop(int(id))
-            resp.media = {"success": True}
-        except IndexError:
+        user_id = int(id) if id.isdecimal() else None
+
+        if user_id not in users:
             resp.status = HTTP("400")
+            return
+
+        del users[user_id]
+        resp.media = {"success": True}
 
 
 class Users(Resource):
@@ -110,17 +122,13 @@ class Users(Resource):
         :accepts [json,xml]:      Accept types
         :return [json xml]:       Return JSON of users
         """
-        results = []
-        p = req.params
-
-        if any(p.values()):
-            for user in users:
-                if user["username"] == p.get("username", None):
-                    results.append(user)
-                elif user["email"] == p.get("email", None):
-                    results.append(user)
+        username = req.params.get("username")
+        email = req.params.get("email")
+
+        if username or email:
+            results = [x for x in users.values() if x["username"] == username or x["email"] == email]
         else:
-            results = users
+            results = list(users.values())
 
         resp.media = results
 
@@ -135,6 +143,6 @@ class Users(Resource):
         :accepts [json xml]:      The body content type
         :return json:
         """
-        p = req.params
-        users.append(p)
-        resp.media = len(users) - 1
+        user_id = next(user_ids)
+        users[user_id] = req.params
+        resp.media = user_id
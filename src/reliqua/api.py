@@ -33,9 +33,10 @@ import uuid
 import falcon
 from falcon_cors import CORS
 
-from .auth import AuthMiddleware
+from .auth import AccessResource, AuthMiddleware
 from .docs import Docs
 from .media_handlers import JSONHandler, TextHandler, YAMLHandler
+from .middleware import Parameter
 from .openapi import OpenApi
 from .resources.base import Resource
 from .sphinx_parser import SphinxParser
@@ -113,12 +114,15 @@ class Api(falcon.App):
 
         self.req_options.auto_parse_form_urlencoded = True
         self.resource_path = resource_path
+        self.parser = SphinxParser()
 
         self._add_handlers()
         self._load_resources()
         self._parse_docstrings()
         self._add_routes()
         self._add_docs()
+        self._build_parameters()
+        self._build_access()
 
     def _add_handlers(self):
         extra_handlers = {
@@ -154,12 +158,11 @@ class Api(falcon.App):
         return re.search(r"^on_([a-z]+)$", name)
 
     def _parse_methods(self, resource, route, methods):
-        parser = SphinxParser()
         for name in methods:
             operation_id = f"{resource.__class__.__name__}.{name}"
             action = re.search(r"on_(delete|get|patch|post|put)", name).group(1)
             method = getattr(resource, name)
-            resource.__data__[route][action] = parser.parse(method, operation_id=operation_id)
+            resource.__data__[route][action] = self.parser.parse(method, operation_id=operation_id)
 
     def _parse_resource(self, resource):
         for route, data in resource.__routes__.items():
@@ -172,6 +175,23 @@ class Api(falcon.App):
         for resource in self.resources:
             resource.__data__ = {}
             self._parse_resource(resource)
+            resource.__has_params__ = any(
+                operation["parameters"] for actions in resource.__data__.values() for operation in actions.values()
+            )
+
+    def _build_parameters(self):
+        # build the middleware parameters once at startup, keyed by endpoint and method
+        for resource in self.resources:
+            resource.__params__ = {
+                (route, method): tuple(Parameter(**x) for x in operation["parameters"])
+                for route, actions in resource.__data__.items()
+                for method, operation in actions.items()
+            }
+
+    def _build_access(self):
+        # normalize the resource auth maps once at startup instead of on first request
+        for resource in self.resources:
+            AccessResource.resource_roles(resource)
 
     def _get_classes(self, filename):
         classes = []
@@ -5,6 +5,7 @@ Copyright 2016-2024.
 """
 
 import configparser
+import os
 
 from gunicorn.app.base import BaseApplication
 
@@ -19,19 +20,19 @@ def load_config(config_file):
     :param str config_file:    Configuration file
     :return dict:              Options dictionary
     """
-    params = {}
+    section = "config"
 
-    try:
-        section = "config"
-        config = configparser.ConfigParser()
-        config.read(config_file)
+    if not config_file or not os.path.isfile(config_file):
+        return {}
 
-        for option in config.options(section):
-            params[option] = config.get(section, option)
-    except TypeError:
-        pass
+    # values are used as-is, no interpolation
+    config = configparser.RawConfigParser()
+    config.read(config_file)
 
-    return params
+    if not config.has_section(section):
+        return {}
+
+    return dict(config.items(section))
 
 
 class Application(BaseApplication):
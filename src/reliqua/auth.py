@@ -4,27 +4,30 @@ Reliqua Framework.
 Copyright 2016-2024.
 """
 
-import base64
+import binascii
 import re
 
 import falcon
 
+try:
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
 
-def is_base64(data):
+
+def role_set(roles):
     """
-    Return if string is base64.
+    Return roles as a set.
 
-    Check if string is base64 encoded.
+    A single role may be given as a string rather than a list.
 
-    :param str data:     Base64 string
-    :return bool:        True is base64
+    :param roles:        Role or list of roles
+    :return frozenset:   Roles
     """
-    try:
-        base64.b64decode(data).decode("utf-8")
-    except (base64.binascii.Error, UnicodeDecodeError):
-        return False
+    if isinstance(roles, str):
+        return frozenset((roles,))
 
-    return True
+    return frozenset(roles or ())
 
 
 class AccessControl:
@@ -115,8 +118,8 @@ class AccessList(AccessControl):
         :param list methods:       List of methods to apply rules
         :param str default_mode:   Default mode (allow|deny)
         """
-        self.routes = [x.lower() for x in routes]
-        self.methods = [x.lower() for x in methods]
+        self.routes = frozenset(x.lower() for x in routes or ())
+        self.methods = frozenset(x.lower() for x in methods or ())
         self.default_mode = default_mode
 
     def authorized(self, role, _route, _method, _resource):
@@ -134,21 +137,15 @@ class AccessList(AccessControl):
         :param str method:   HTTP method invoked
         :return bool:        True if authentication is required
         """
-        matched = False
-        required = self.default_mode != "allowed"
-
-        if route.lower() in self.routes or method.lower() in self.methods:
-            matched = True
+        matched = route.lower() in self.routes or method.lower() in self.methods
 
         # check if authentication is required
         if self.default_mode == "allow":
             # if default mode is allow, then a match means auth required
-            required = not matched
-        else:
-            # default mode is deny, then a match means auth not required
-            required = matched
+            return not matched
 
-        return required
+        # default mode is deny, then a match means auth not required
+        return matched
 
 
 class AccessMap(AccessControl):
@@ -184,7 +181,22 @@ class AccessMap(AccessControl):
         :param list access_map:    Dictionary of rules
         :return:
         """
-        self.access_map = access_map
+        # normalize keys and store roles as sets for constant time lookups
+        self.access_map = {
+            route.lower(): {method.lower(): role_set(roles) for method, roles in methods.items()}
+            for route, methods in access_map.items()
+        }
+
+    def roles(self, route, method):
+        """
+        Return the roles for the route and method.
+
+        :param str route:    Route being called
+        :param str method:   HTTP method invoked
+        :return frozenset:   Roles allowed access
+        """
+        methods = self.access_map.get(route.lower(), {})
+        return methods.get("*") or methods.get(method.lower()) or frozenset()
 
     def authorized(self, role, route, method, _resource):
         """
@@ -195,12 +207,8 @@ class AccessMap(AccessControl):
         :param str method:   HTTP method being invoked
         :return bool:        True if authorized
         """
-        route = self.access_map.get(route)
-        roles = route.get("*") or route.get(method)
-        if role in roles or "*" in roles:
-            return True
-
-        return False
+        roles = self.roles(route, method)
+        return "*" in roles or role in roles
 
     def authentication_required(self, route, method, _resource):
         """
@@ -213,15 +221,9 @@ class AccessMap(AccessControl):
         :param str method:   The http method invoked
         :return bool:        True if e
         """
-        route = self.access_map.get(route)
-        roles = route.get("*") or route.get(method)
-
         # if method is specified and has a wildcard role
         # then authentication is not required
-        if roles and "*" in roles:
-            return False
-
-        return True
+        return "*" not in self.roles(route, method)
 
 
 class AccessResource(AccessControl):
@@ -261,6 +263,33 @@ class AccessResource(AccessControl):
         self.default_mode = default_mode
         self.raise_on_undefined = raise_on_undefined
 
+    @staticmethod
+    def resource_roles(resource):
+        """
+        Return the normalized auth map for the resource.
+
+        The resource auth dictionary is converted once, with lowercase
+        methods and roles as sets, and cached on the resource.
+
+        :param Resource resource:    Route resource
+        :return dict:                Roles keyed by lowercase method
+        """
+        try:
+            return resource.__access__
+        except AttributeError:
+            pass
+
+        auth = getattr(resource, "__auth__", None) or {}
+        access = {method.lower(): role_set(roles) for method, roles in auth.items()}
+
+        try:
+            resource.__access__ = access
+        except AttributeError:
+            # resource does not allow attributes, normalize on each call
+            pass
+
+        return access
+
     def authorized(self, role, _route, method, resource):
         """
         Return whether client is allowed to access resource.
@@ -270,8 +299,8 @@ class AccessResource(AccessControl):
         :param Resource resource:    Route resource
         :return bool:                True if authorized
         """
-        auth = getattr(resource, "__auth__", {})
-        roles = auth.get("*", []) or auth.get(method, [])
+        auth = self.resource_roles(resource)
+        roles = auth.get("*") or auth.get(method.lower())
 
         # if no roles are defined skip authorization
         # or raise an exception
@@ -281,10 +310,7 @@ class AccessResource(AccessControl):
 
             return True
 
-        if role in roles or "*" in roles:
-            return True
-
-        return False
+        return "*" in roles or role in roles
 
     def authentication_required(self, _route, method, resource):
         """
@@ -298,8 +324,8 @@ class AccessResource(AccessControl):
         :param Resource resource:    Route resource
         :return bool:       True if authentication is required
         """
-        auth = getattr(resource, "__auth__", {})
-        roles = auth.get(method.lower(), []) or auth.get(method.upper(), []) or auth.get("*", [])
+        auth = self.resource_roles(resource)
+        roles = auth.get(method.lower()) or auth.get("*")
 
         # If no roles are defined and default mode is allow
         # then no authentication is required.
@@ -525,10 +551,13 @@ class BasicAuthentication(Authentication):
 
         token = m.group(1)
 
-        if not is_base64(token):
-            raise falcon.HTTPUnauthorized(description="Invalid Token")
+        # decode once, invalid base64 or UTF-8 is an invalid token
+        try:
+            credentials = b64decode(token, validate=True).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError) as exception:
+            raise falcon.HTTPUnauthorized(description="Invalid Token") from exception
 
-        username, _, password = base64.b64decode(token).decode("utf-8").partition(":")
+        username, _, password = credentials.partition(":")
 
         return username, password
 
@@ -616,11 +645,7 @@ class MultiAuthentication(Authentication):
 
     def dict(self):
         """Return OpenAPI Schema."""
-        schema = {}
-        for auth in self.authenticators:
-            schema.update(auth.dict())
-
-        return schema
+        return {k: v for auth in self.authenticators for k, v in auth.dict().items()}
 
 
 class AuthMiddleware:
@@ -638,11 +663,7 @@ class AuthMiddleware:
 
     def dict(self):
         """Return OpenAPI Schema."""
-        schema = {}
-        for auth in self.authenticators:
-            schema.update(auth.dict())
-
-        return schema
+        return {k: v for auth in self.authenticators for k, v in auth.dict().items()}
 
     def authenticate(self, request, response, resource):
         """
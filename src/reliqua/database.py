@@ -6,7 +6,6 @@ Copyright 2016-2024.
 
 import binascii
 import os
-from base64 import b64decode, b64encode
 
 from peewee import (
     Model,
@@ -16,6 +15,11 @@ from peewee import (
     SqliteDatabase,
 )
 
+try:
+    from pybase64 import b64decode, b64encode
+except ImportError:
+    from base64 import b64decode, b64encode
+
 db = Proxy()
 
 
@@ -27,7 +31,7 @@ def is_b64(string):
     :return:        True if string is base64 encoded
     """
     try:
-        return b64encode(b64decode(string)) == string
+        return b64encode(b64decode(string, validate=True)) == string
     except (ValueError, TypeError, binascii.Error):
         return False
 
@@ -4,7 +4,13 @@ Reliqua Framework.
 Copyright 2016-2024.
 """
 
-from reliqua.resources.base import Resource
+import hashlib
+
+import falcon
+
+from reliqua.resources.base import Resource, not_modified
+
+from .media_handlers import JSONHandler
 
 
 class Docs(Resource):
@@ -55,17 +61,28 @@ class Docs(Resource):
         """
         Create Docs instance.
 
+        The schema does not change once the API is built, so it is
+        serialized and tagged once here rather than on every request.
+
         :param dict schema:    Documents JSON schema
         :return:               None
         """
         self.schema = schema
+        self.data = JSONHandler().serialize(schema, falcon.MEDIA_JSON)
+        self.etag = hashlib.blake2b(self.data, digest_size=8).hexdigest()
 
-    def on_get(self, _req, resp):
+    def on_get(self, req, resp):
         """
         Return the JSON document schema.
 
+        :param Request req:          Request object
         :param Response response:    Response object
         :return:                     None
         """
         resp.set_header("Access-Control-Allow-Origin", "*")
-        resp.media = self.schema
+
+        if not_modified(req, resp, self.etag):
+            return
+
+        resp.content_type = falcon.MEDIA_JSON
+        resp.data = self.data
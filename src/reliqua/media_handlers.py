@@ -6,13 +6,39 @@ Copyright 2016-2024.
 
 import json
 from datetime import date, datetime, time
-from functools import partial
+from functools import lru_cache, partial
 
 import falcon
 import yaml
 from falcon.media import BaseHandler
 from falcon.media import JSONHandler as FalconJSONHandler
-from yaml import SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CDumper as Dumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import Dumper, SafeLoader
+
+
+@lru_cache(maxsize=4096)
+def datetime_str(obj, _tzinfo=None):
+    """
+    Return the string form of a date, time or datetime.
+
+    Results are cached since payloads commonly repeat the same
+    timestamps. The tzinfo is part of the cache key, because aware
+    values in different zones compare equal but format differently.
+
+    :param obj:         date, time or datetime object
+    :param _tzinfo:     tzinfo of the object
+    :return str:        formatted value
+    """
+    return str(obj)
 
 
 class YAMLHandler(BaseHandler):
@@ -40,7 +66,7 @@ class YAMLHandler(BaseHandler):
         :param media:       media to serialize
         :return:            serialized YAML
         """
-        result = yaml.dump(media)
+        result = yaml.dump(media, Dumper=Dumper)
 
         try:
             result = result.encode("utf-8")
@@ -74,14 +100,12 @@ class TextHandler(BaseHandler):
         :param media:       media to serialize
         :return:            serialized text
         """
-        result = f"{media}"
-
-        try:
-            result = result.encode("utf-8")
-        except AttributeError:
-            pass
+        # plain strings are encoded directly, anything else is formatted first,
+        # including str subclasses such as enums that format differently
+        if type(media) is not str:
+            media = f"{media}"
 
-        return result
+        return media.encode("utf-8")
 
 
 class JSONHandler(FalconJSONHandler):
@@ -99,11 +123,38 @@ class JSONHandler(FalconJSONHandler):
         :return:        converted object
         """
         if isinstance(obj, (datetime, time, date)):
-            return str(obj)
+            return datetime_str(obj, getattr(obj, "tzinfo", None))
         return obj
 
+    def orjson_dumps(self, media):
+        """
+        Serialize media with orjson.
+
+        Media orjson cannot encode, such as integers wider than 64 bits,
+        is serialized with json instead. Unlike json, orjson writes NaN
+        and Infinity as null.
+
+        :param media:       media to serialize
+        :return bytes:      serialized JSON
+        """
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+        try:
+            return orjson.dumps(media, default=self.converter, option=option)
+        except orjson.JSONEncodeError:
+            return json.dumps(media, ensure_ascii=False, default=self.converter).encode("utf-8")
+
     def __init__(self, dumps=None, loads=None):
-        """Create JSONHandler instance."""
+        """
+        Create JSONHandler instance.
+
+        Use orjson when available, passing dates and times to the
+        converter so they are formatted the same as with json.
+        """
+        if orjson:
+            dumps = dumps or self.orjson_dumps
+            loads = loads or orjson.loads
+
         dumps = dumps or partial(json.dumps, ensure_ascii=False, default=self.converter)
         loads = loads or json.loads
         super().__init__(dumps, loads)
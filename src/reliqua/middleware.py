@@ -4,11 +4,17 @@ Reliqua Framework.
 Copyright 2016-2024.
 """
 
-import json
-import re
+import sys
 
 import falcon
 
+from .openapi import LIST_REGEX
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 TRANSFORMS = {
     "string": str,
     "str": str,
@@ -18,7 +24,36 @@ TRANSFORMS = {
     "int": int,
     "boolean": bool,
     "bool": bool,
-    "object": json.loads,
+    "object": json_loads,
+    "list": list,
+    "array": list,
+}
+
+TRUE_STRINGS = frozenset(("true", "t", "yes", "y", "on", "1"))
+FALSE_STRINGS = frozenset(("false", "f", "no", "n", "off", "0"))
+
+# canonical datatype names keyed by their aliases
+DATATYPES = {
+    "string": "str",
+    "number": "float",
+    "integer": "int",
+    "boolean": "bool",
+    "dict": "object",
+    "json": "object",
+    "array": "list",
+}
+
+PYTHON_TYPES = {
+    "string": str,
+    "str": str,
+    "number": float,
+    "float": float,
+    "integer": int,
+    "int": int,
+    "boolean": bool,
+    "bool": bool,
+    "object": dict,
+    "dict": dict,
     "list": list,
     "array": list,
 }
@@ -26,7 +61,28 @@ TRANSFORMS = {
 
 def python_type(s):
     """Return Python type from string."""
-    return __builtins__.get(s)
+    return PYTHON_TYPES.get(s, str)
+
+
+def to_bool(value):
+    """
+    Return the boolean value of a parameter.
+
+    :param value:     Value to convert
+    :return bool:     Converted value or ``None`` if not a boolean value
+    """
+    # already converted, ex: from a JSON body
+    if isinstance(value, bool):
+        return value
+
+    value = str(value).lower()
+
+    if value in TRUE_STRINGS:
+        return True
+    if value in FALSE_STRINGS:
+        return False
+
+    return None
 
 
 class Parameter:
@@ -36,15 +92,46 @@ class Parameter:
     This class represents a python typed parameter.
     """
 
+    __slots__ = (
+        "converter",
+        "datatype",
+        "default",
+        "description",
+        "enum",
+        "examples",
+        "explode",
+        "format",
+        "location",
+        "max",
+        "min",
+        "name",
+        "required",
+        "transform",
+    )
+
     def __init__(self, **kwargs):
         """
         Create a parameter instance.
 
-        Creates a parameter object and set attributes.
+        Creates a parameter object and set attributes. Options
+        that are not parameter attributes are ignored.
         """
-        self.default = None
-        self.required = False
-        self.__dict__.update(kwargs)
+        for key in self.__slots__:
+            setattr(self, key, kwargs.get(key))
+
+        self.required = kwargs.get("required", False)
+
+        if self.name:
+            self.name = sys.intern(self.name)
+
+        # resolve list item types once, ex: list[int]
+        if self.datatype and (m := LIST_REGEX.search(self.datatype)):
+            self.datatype = "list"
+            self.transform = TRANSFORMS.get(m.group(1))
+
+        self.datatype = DATATYPES.get(self.datatype, self.datatype)
+        self.transform = self.transform or str
+        self.converter = CONVERTERS.get(self.datatype, Converter.as_str)
 
 
 class Converter:
@@ -106,7 +193,20 @@ class Converter:
         :param bool required:   ``True`` if the parameter is required else ``False``
         :return bool:           Converted parameter value
         """
-        return req.get_param_as_bool(name, default=default, required=required)
+        value = req.get_param(name, default=default, required=required)
+
+        if value is None:
+            return None
+
+        # blank values are true, as with Falcon's get_param_as_bool
+        if value == "":
+            return True
+
+        result = to_bool(value)
+        if result is None:
+            raise falcon.HTTPInvalidParam('The value of the parameter must be "true" or "false".', name)
+
+        return result
 
     @staticmethod
     def as_object(req, name, default=None, required=False, **_kwargs):
@@ -119,9 +219,16 @@ class Converter:
         :param bool required:   ``True`` if the parameter is required else ``False``
         :return:                Converted parameter value
         """
+        value = req.params.get(name)
+
+        if value is None:
+            if required:
+                raise falcon.HTTPMissingParam(name)
+            return default
+
         # parameter data is already converted
-        if isinstance(req.params[name], dict):
-            return req.params[name]
+        if isinstance(value, dict):
+            return value
 
         return req.get_param_as_json(name, default=default, required=required)
 
@@ -137,16 +244,30 @@ class Converter:
         :param transform:       Function to transform the list items
         :return:                Converted parameter value
         """
+        value = req.params.get(name)
+
+        if value is None:
+            if required:
+                raise falcon.HTTPMissingParam(name)
+            if default is None:
+                return None
+
+            # the default is split and transformed like a request value
+            value = default
+
         # if param is a string, convert to list and strip whitespace
         # handles cases where commas were encoded and bypassed Falcon's built-in conversion
-        # also removes empty strings from list
-        if isinstance(req.params[name], str) and req.params[name]:
-            value = req.params[name].strip("'\"").split(",")
-            req.params[name] = [x.strip() for x in value]
+        # empty strings are falsy, so filter drops them without a python level test
+        if isinstance(value, str):
+            items = filter(None, map(str.strip, value.strip("'\"").split(",")))
+        else:
+            # list items may be falsy values such as 0, only drop empty strings
+            items = [x for x in (value if isinstance(value, list) else [value]) if x != ""]
 
-        items = req.get_param_as_list(name, default=default, required=required, transform=transform)
-
-        return [item for item in items if item != ""]
+        try:
+            return list(map(transform, items)) if transform else list(items)
+        except ValueError as exception:
+            raise falcon.HTTPInvalidParam("The value is not formatted correctly.", name) from exception
 
     @staticmethod
     def as_array(req, name, default=None, required=False, transform=None, **_kwargs):
@@ -160,26 +281,36 @@ class Converter:
         :param transform:       Function to transform the list items
         :return:                Converted parameter value
         """
-        Converter.as_list(req, name, default=default, required=required, transform=transform)
+        return Converter.as_list(req, name, default=default, required=required, transform=transform)
 
     @staticmethod
-    def convert(req, parameter, transform=None):
+    def convert(req, parameter, transform=None, datatype=None):
         """
         Convert parameter types to Python types.
 
         :param Request req:          Request object
         :param Parameter parameter:  Parameter object
-        :param str transform:        Transform method name
+        :param str transform:        Transform method name (default is the parameter item type)
+        :param str datatype:         Datatype override (default is the parameter datatype)
         :return:                     None
         """
+        if datatype:
+            converter = CONVERTERS.get(datatype, Converter.as_str)
+        else:
+            datatype = parameter.datatype
+            converter = parameter.converter
+
         # pre-check if already type converted and skip if needed
         value = req.get_param(parameter.name, required=parameter.required)
-        if isinstance(value, python_type(parameter.datatype)):
+        if isinstance(value, python_type(datatype)):
             return value
 
-        converter = getattr(Converter, f"as_{parameter.datatype}", Converter.as_str)
-        transform = TRANSFORMS.get(transform, str)
-        default = transform(parameter.default) if transform and parameter.default else None
+        transform = TRANSFORMS.get(transform, parameter.transform)
+        default = parameter.default or None
+
+        # list converters transform each item of the default themselves
+        if default is not None and transform and converter not in (Converter.as_list, Converter.as_array):
+            default = transform(default)
 
         return converter(
             req,
@@ -190,9 +321,22 @@ class Converter:
         )
 
 
+CONVERTERS = {
+    "str": Converter.as_str,
+    "float": Converter.as_float,
+    "int": Converter.as_int,
+    "bool": Converter.as_bool,
+    "object": Converter.as_object,
+    "list": Converter.as_list,
+    "array": Converter.as_array,
+}
+
+
 class ProcessParams:
     """This middleware will process parameters and convert them to python types."""
 
+    __slots__ = ()
+
     def _check_required(self, request, parameter):
         """
         Check if specified parameter is required.
@@ -205,25 +349,30 @@ class ProcessParams:
         :return:                        None
         :raises falcon.HTTPBadRequest:  Falcon bad request exception
         """
-        value = parameter.default or request.params.get(parameter.name)
-        if parameter.required and not value:
+        # present values count even when falsy, ex: 0 or false from a JSON body
+        name = parameter.name
+        if parameter.required and parameter.default is None and name not in request.params:
             raise falcon.HTTPBadRequest(
                 title="Bad Request",
-                description=f"Missing parameter '{parameter.name}'",
+                description=f"Missing parameter '{name}'",
             )
 
-    def _convert(self, request, parameter):
-        pass
-
     def _parse_operators(self, request):
         operators = {}
-        name = ""
+        params = request.params
+
+        # most requests have no operators, avoid copying the keys
+        if not any("__" in x for x in params):
+            return operators
+
+        for param in list(params):
+            if "__" not in param:
+                continue
 
-        for param in list(request.params.keys()):
             name, _, operator = param.partition("__")
             if operator:
                 operators[name] = operator
-                request.params[name] = request.params.pop(param)
+                params[name] = params.pop(param)
 
         return operators
 
@@ -232,20 +381,15 @@ class ProcessParams:
         """
         Return resource parameters.
 
-        Return the resource parameter data dictionary.
+        Return the parameters built by the API at startup for the
+        request endpoint and method.
 
         :param Request request:            Request object
-        :param Response response:          Response object
-        :return list[dict]                 Return list of parameter dictionaries
+        :param Resource resource:          Resource object
+        :return tuple[Parameter]           Return tuple of parameters
         """
-        try:
-            endpoint = request.uri_template
-            method = request.method.lower()
-            params = resource.__data__[endpoint][method]["parameters"]
-        except (TypeError, AttributeError, KeyError):
-            params = []
-
-        return [Parameter(**x) for x in params]
+        params = getattr(resource, "__params__", {})
+        return params.get((request.uri_template, request.method.lower()), ())
 
     def process(self, request, parameters):
         """
@@ -263,10 +407,12 @@ class ProcessParams:
         if operators:
             request.params["operators"] = operators
 
+        params = request.params
+        converted = {}
+
         # use the docs schema to validate
         for parameter in parameters:
-            transform = None
-            present = parameter.name in request.params
+            present = parameter.name in params
 
             # check for required parameters
             self._check_required(request, parameter)
@@ -276,19 +422,11 @@ class ProcessParams:
                 continue
 
             # for operators in and between, datatype must be a list
-            if operators.get(parameter.name) in ["in", "between"]:
-                if "list" not in parameter.datatype:
-                    parameter.datatype = "list"
-
-            if m := re.search(r"list\[(\w+)]", parameter.datatype):
-                parameter.datatype = "list"
-                transform = m.group(1)
-
-            request.params[parameter.name] = Converter.convert(
-                request,
-                parameter,
-                transform=transform,
-            )
+            datatype = "list" if operators and operators.get(parameter.name) in ["in", "between"] else None
+
+            converted[parameter.name] = Converter.convert(request, parameter, datatype=datatype)
+
+        params.update(converted)
 
     def process_form(self, form):
         """
@@ -320,15 +458,27 @@ class ProcessParams:
         :param list params:         Resource parameters
         :return:                    None
         """
-        schema = self.get_resource_parameters(request, resource)
+        media = None
+
+        # only parse requests with a body, the media handler is chosen by content type
+        if request.content_length:
+            media = request.get_media(default_when_empty=None)
 
         # combine parameters from query, path, and body
-        for media_params in [params, request.get_media(default_when_empty=None)]:
-            if isinstance(media_params, dict):
-                request.params.update(media_params)
-            elif isinstance(media_params, falcon.media.multipart.MultipartForm):
-                media_params = self.process_form(media_params)
-                request.params.update(media_params)
+        if params:
+            request.params.update(params)
+
+        if isinstance(media, falcon.media.multipart.MultipartForm):
+            media = self.process_form(media)
+
+        if isinstance(media, dict):
+            request.params.update(media)
+
+        # resources without documented parameters need no further processing
+        if not getattr(resource, "__has_params__", False):
+            return
+
+        schema = self.get_resource_parameters(request, resource)
 
         # if resource has no schema, skip further processing
         if not schema:
@@ -5,6 +5,9 @@ Copyright 2016-2024.
 """
 
 import re
+from functools import lru_cache
+
+LIST_REGEX = re.compile(r"(?:list|array)\[(\w+)\]")
 
 
 def camelcase(string):
@@ -33,7 +36,9 @@ CONTENT_MAP = {
 }
 
 
-BINARY_TYPES = ["binary", "gzip", "jpeg", "gif"]
+BINARY_TYPES = frozenset(("binary", "gzip", "jpeg", "gif"))
+
+BODY_LOCATIONS = frozenset(("body", "form"))
 
 
 TYPE_MAP = {
@@ -59,7 +64,7 @@ DEFAULT_RESPONSE = {
     },
 }
 
-verbs = ["get", "patch", "put", "post", "delete"]
+verbs = ("get", "patch", "put", "post", "delete")
 
 
 class Parameter:
@@ -69,6 +74,24 @@ class Parameter:
     This class represents an OpenAPI parameter.
     """
 
+    __slots__ = (
+        "datatype",
+        "default",
+        "description",
+        "enum",
+        "examples",
+        "explode",
+        "format",
+        "in_body",
+        "items_type",
+        "location",
+        "max",
+        "min",
+        "name",
+        "required",
+        "schema",
+    )
+
     def __init__(
         self,
         name=None,
@@ -113,55 +136,63 @@ class Parameter:
         self.min = min
         self.max = max
         self.examples = examples
-        self._datatype = datatype
 
         # path parameters are always required
         if self.location == "path":
             self.required = True
 
-    @property
-    def datatype(self):
-        """Return the parameter datatype."""
-        value = self._datatype
-        a, _, b = value.partition("|")
-
-        # handle defined list type ex: list[str]
-        if re.search(r"list\[(\w+)]", a):
-            a = "list"
+        self.in_body = self.location in BODY_LOCATIONS
+        self.datatype, self.items_type = self.parse_datatype(datatype)
+        self.schema = self._schema()
 
-        return f"{TYPE_MAP[a]}|{TYPE_MAP[b]}" if b else f"{TYPE_MAP[a]}"
-
-    @property
-    def items_type(self):
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def parse_datatype(datatype):
         """
-        Return a list item type.
+        Parse the parameter datatype.
+
+        Return the OpenAPI datatype and, when a parameter type is
+        of the form list[type], such as list[int], the list item type.
 
-        Return the list type when a parameter type is
-        of the form list[type], such as list[int]
+        Results are cached since the same types repeat across parameters.
 
-        :return str:     The list item type
+        :param str datatype:    Parameter type
+        :return tuple:          The datatype and list item type
         """
-        if not self._datatype:
-            return None
+        # most datatypes are not unions
+        if "|" in datatype:
+            a, _, b = datatype.partition("|")
+        else:
+            a, b = datatype, None
 
-        if m := re.search(r"(?:list|array)\[(\w+)\]", self._datatype):
-            return TYPE_MAP[m.group(1)]
+        # handle defined list type ex: list[str]
+        if m := LIST_REGEX.search(a):
+            a = "list"
 
-        return None
+        datatype = f"{TYPE_MAP[a]}|{TYPE_MAP[b]}" if b else TYPE_MAP[a]
+        items_type = TYPE_MAP[m.group(1)] if m else None
+
+        return datatype, items_type
 
     def __repr__(self):
         """Return object representation."""
-        return str(self.__dict__)
+        return str({x: getattr(self, x) for x in self.__slots__})
 
-    @property
-    def schema(self):
+    def _schema(self):
         """Return parameter schema."""
         _schema = {"type": self.datatype}
         if self.items_type:
             _schema["items"] = {"type": self.items_type}
-        for x in ["enum", "min", "max", "default", "examples"]:
-            if value := getattr(self, x):
-                _schema[x] = value
+        if self.enum:
+            _schema["enum"] = self.enum
+        if self.min:
+            _schema["min"] = self.min
+        if self.max:
+            _schema["max"] = self.max
+        if self.default:
+            _schema["default"] = self.default
+        if self.examples:
+            _schema["examples"] = self.examples
 
         if self.in_request_body():
             _schema["description"] = self.description
@@ -177,10 +208,7 @@ class Parameter:
 
         :return bool:     True if in request body
         """
-        if self.location in ["body", "form"]:
-            return True
-
-        return False
+        return self.in_body
 
     def request_body(self):
         """
@@ -227,6 +255,8 @@ class Parameter:
 class Response:
     """Response class."""
 
+    __slots__ = ("code", "content", "description", "schema")
+
     def __init__(self, code=None, description=None, content=None, schema=None):
         """
         Create response instance.
@@ -244,13 +274,12 @@ class Response:
 
     def __repr__(self):
         """Return a printable representational string."""
-        return str(self.__dict__)
+        return str({x: getattr(self, x) for x in self.__slots__})
 
     def dict(self):
         """Return dict of data."""
-        content_types = [CONTENT_MAP.get(x) for x in self.content]
         schema = {"schema": {"$ref": f"#/components/schemas/{self.schema}"}}
-        content = {x: schema for x in content_types}
+        content = {CONTENT_MAP.get(x): schema for x in self.content}
 
         return {
             "description": self.description,
@@ -261,6 +290,23 @@ class Response:
 class Operation:
     """Operation Class."""
 
+    __slots__ = (
+        "accepts",
+        "callbacks",
+        "content_types",
+        "description",
+        "operation",
+        "operation_id",
+        "operation_parameters",
+        "parameters",
+        "request_body_parameters",
+        "required_body_parameters",
+        "responses",
+        "return_types",
+        "summary",
+        "tags",
+    )
+
     def __init__(
         self,
         operation=None,
@@ -299,49 +345,36 @@ class Operation:
         self.callbacks = callbacks or {}
         self.parameters = [Parameter(**x) for x in parameters or []]
         self.responses = [Response(**x, content=return_types) for x in responses or []]
-        self._accepts = accepts or ["*/*"]
-        self.request_body_parameters = {x.name: x.dict() for x in self.parameters if x.in_request_body()}
-
-    @property
-    def accepts(self):
-        """Return accepts type."""
-        if self._accepts:
-            return self._accepts
-        if self.has_form():
-            return ["form"]
-
-        return ["*/*"]
+        self.accepts = accepts or ["*/*"]
+        self.content_types = [CONTENT_MAP.get(x) for x in self.accepts]
+        self.operation_parameters = []
+        self.request_body_parameters = {}
+        self.required_body_parameters = []
+
+        # split parameters between the operation and the request body in one pass
+        for parameter in self.parameters:
+            if parameter.in_body:
+                self.request_body_parameters[parameter.name] = parameter.schema
+                if parameter.required is True:
+                    self.required_body_parameters.append(parameter.name)
+            else:
+                self.operation_parameters.append(parameter.parameter())
 
     def binary_body(self):
         """Return binary body."""
-        accepts = CONTENT_MAP.get(self.accepts)
-        return {
-            "content": {
-                accepts: {
-                    "schema": {
-                        "type": "string",
-                        "format": "binary",
-                    }
-                }
-            }
-        }
-
-    def has_form(self):
-        """
-        Return whether operation has form data.
-
-        Return `True` if the operation has form data parameters.
-
-        :return bool:     True if has form data
-        """
-        return [x for x in self.parameters if x.location == "form"] != []
+        schema = {"schema": {"type": "string", "format": "binary"}}
+        return {"content": {x: schema for x in self.content_types}}
 
     def body(self):
         """Return request body."""
-        accepts = [CONTENT_MAP.get(x) for x in self.accepts]
-        required = [k for k, v in self.request_body_parameters.items() if v.get("required") is True]
-        schema = {"schema": {"type": "object", "required": required, "properties": self.request_body_parameters}}
-        content = {x: schema for x in accepts}
+        schema = {
+            "schema": {
+                "type": "object",
+                "required": self.required_body_parameters,
+                "properties": self.request_body_parameters,
+            }
+        }
+        content = {x: schema for x in self.content_types}
 
         return {
             "description": self.description,
@@ -350,25 +383,29 @@ class Operation:
 
     def request_body(self):
         """Return request body."""
-        if self.accepts in BINARY_TYPES:
+        if BINARY_TYPES.issuperset(self.accepts):
             return self.binary_body()
 
         return self.body()
 
-    def dict(self):
-        """Return dict of data."""
+    def definition(self):
+        """Return the operation definition."""
         operation = {
             "tags": self.tags,
             "summary": self.summary,
             "description": self.description,
             "operationId": self.operation_id,
-            "parameters": [x.dict() for x in self.parameters if not x.in_request_body()],
+            "parameters": self.operation_parameters,
             "responses": {x.code: x.dict() for x in self.responses},
         }
         if self.request_body_parameters:
             operation["requestBody"] = self.request_body()
 
-        return {self.operation: operation}
+        return operation
+
+    def dict(self):
+        """Return dict of data."""
+        return {self.operation: self.definition()}
 
 
 class ResourceSchema:
@@ -387,9 +424,9 @@ class ResourceSchema:
         self.name = resource.__class__.__name__.capitalize()
         self.tags = getattr(resource, "__tags__", [self.name.lower()])
         self.components = getattr(resource, "__components__", {})
-        self.security = {verb.lower(): auth for verb, auth in getattr(resource, "__auth__", {}).items()}
         self.parser = parser() if parser else None
         self.paths = {}
+        self._schemas = {}
 
     def methods(self):
         """
@@ -399,14 +436,7 @@ class ResourceSchema:
 
         :return list:       List of methods
         """
-        _methods = []
-        for verb in verbs:
-            method = getattr(self.resource, f"on_{verb}", None)
-            if not method or not method.__doc__:
-                continue
-            _methods.append(method)
-
-        return _methods
+        return [method for verb in verbs if (method := getattr(self.resource, f"on_{verb}", None)) and method.__doc__]
 
     def parse(self):
         """Parse the resource."""
@@ -424,7 +454,10 @@ class ResourceSchema:
         for response in operation["responses"]:
             name = response["schema"]
             if name:
-                schema = getattr(self.resource, name, {})
+                # responses commonly share schemas across routes
+                if name not in self._schemas:
+                    self._schemas[name] = getattr(self.resource, name, {})
+                schema = self._schemas[name]
             else:
                 schema = {response["code"]: response["description"]}
 
@@ -466,20 +499,23 @@ class ResourceSchema:
         :param str route:         The HTTP route
         :return:
         """
-        self.paths[route] = {}
-        paths = self.resource.__data__[route]
+        operations = {}
 
         # for each resource path add the path to openapi
-        for v in paths.values():
+        for v in self.resource.__data__[route].values():
             data = self.process_parameters(v)
             operation = Operation(tags=self.tags, **data)
-            self.paths[route].update(operation.dict())
+            operations[operation.operation] = operation.definition()
             self.process_responses(v)
 
+        self.paths[route] = operations
+
 
 class Info:
     """Info class."""
 
+    __slots__ = ("contact", "description", "license", "summary", "terms", "title", "version")
+
     def __init__(
         self,
         title=None,
@@ -512,7 +548,7 @@ class Info:
 
     def __repr__(self):
         """Return a printable representational string."""
-        return str(self.__dict__)
+        return str({x: getattr(self, x) for x in self.__slots__})
 
     def dict(self):
         """Return dict of data."""
@@ -529,6 +565,8 @@ class Info:
 class License:
     """License class."""
 
+    __slots__ = ("name", "url")
+
     def __init__(self, name=None, url=None):
         """
         Create license instance.
@@ -542,12 +580,17 @@ class License:
 
     def dict(self):
         """Return dict of data."""
-        return self.__dict__
+        return {
+            "name": self.name,
+            "url": self.url,
+        }
 
 
 class Contact:
     """API Contact information."""
 
+    __slots__ = ("email", "name", "url")
+
     def __init__(self, name=None, url=None, email=None):
         """
         Create contact instance.
@@ -563,11 +606,15 @@ class Contact:
 
     def __repr__(self):
         """Return a printable representational string."""
-        return str(self.__dict__)
+        return str({x: getattr(self, x) for x in self.__slots__})
 
     def dict(self):
         """Return dict of data."""
-        return self.__dict__
+        return {
+            "name": self.name,
+            "url": self.url,
+            "email": self.email,
+        }
 
 
 class OpenApi:
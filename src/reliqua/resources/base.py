@@ -4,6 +4,29 @@ Reliqua framework.
 Copyright 2016-2024.
 """
 
+import falcon
+
+
+def not_modified(req, resp, etag):
+    """
+    Tag the response and check whether the client copy is current.
+
+    Sets the response ETag and, if the request If-None-Match header
+    matches it, sets the status to 304.
+
+    :param Request req:     The request
+    :param Response resp:   The response
+    :param str etag:        ETag of the current representation
+    :return bool:           True if the client copy is current
+    """
+    resp.etag = etag
+
+    if (etags := req.if_none_match) and ("*" in etags or etag in etags):
+        resp.status = falcon.HTTP_304
+        return True
+
+    return False
+
 
 class Resource:
     """
@@ -27,9 +50,7 @@ class Resource:
         :param list exclude:   List of params to exclude
         :return dict:          Dictionary of parameters
         """
-        params = {}
-        exclude = exclude or []
-        for param in req.params:
-            if (not keys or param in keys) and param not in exclude:
-                params[param] = req.params[param]
-        return params
+        keys = frozenset(keys) if keys else None
+        exclude = frozenset(exclude or ())
+
+        return {k: v for k, v in req.params.items() if (keys is None or k in keys) and k not in exclude}
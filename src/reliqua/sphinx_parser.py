@@ -18,8 +18,11 @@ RESPONSE_ITER_REGEX = re.compile(r":response\s+(?P<code>\d+)\s*(?P<schema>\w+)?:
 RETURN_REGEX = re.compile(r":return[s]*\s*(\[(.*?)\]|\w+)")
 ACCEPT_REGEX = re.compile(r":accepts\s*(\[(.*?)\]|\w+)")
 KEYVALUE_REGEX = re.compile(r"(?P<key>\w+)=(?P<value>\S+)")
-OPERATION_REGEX = re.compile(r"on_(delete|get|patch|post|put)")
-SUFFIX_REGEX = re.compile(r"on_(?:delete|get|patch|post|put)_([a-zA-Z0-9_]+)")
+OPERATION_SUFFIX_REGEX = re.compile(r"on_(?P<operation>delete|get|patch|post|put)(?:_(?P<suffix>[a-zA-Z0-9_]+))?")
+SUMMARY_REGEX = re.compile(r"(.*?)\n", re.DOTALL)
+DESCRIPTION_REGEX = re.compile(r"\n\n(.*?):", re.DOTALL)
+LIST_SPLIT_REGEX = re.compile(r",\s*|\s+")
+LINE_BREAK_REGEX = re.compile(r"[ \t]*\n[ \t]*")
 
 
 class SphinxParser:
@@ -95,7 +98,7 @@ class SphinxParser:
     @property
     def summary(self):
         """Return summary."""
-        if match := re.search(r"(.*?)\n", self.doc, re.MULTILINE | re.DOTALL):
+        if match := SUMMARY_REGEX.search(self.doc):
             return match.group(1).replace("\n", " ").strip()
 
         return ""
@@ -103,7 +106,7 @@ class SphinxParser:
     @property
     def description(self):
         """Return description."""
-        if match := re.search(r"\n\n(.*?):", self.doc, re.MULTILINE | re.DOTALL):
+        if match := DESCRIPTION_REGEX.search(self.doc):
             return match.group(1).replace("\n", " ").strip()
 
         return ""
@@ -114,7 +117,8 @@ class SphinxParser:
         _parameters = []
 
         for item in PARAM_ITER_REGEX.finditer(self.doc):
-            string = " ".join([x.strip() for x in item.group(1).splitlines()])
+            # join the lines of a multiline parameter
+            string = LINE_BREAK_REGEX.sub(" ", item.group(1)).strip()
             parameter = self.parse_parameter(string)
             if parameter:
                 _parameters.append(parameter)
@@ -130,19 +134,15 @@ class SphinxParser:
             return []
 
         parsed = m.group(1).strip("[]") or "json"
-        return re.split(r",\s*|\s+", parsed)
+        return LIST_SPLIT_REGEX.split(parsed)
 
     @property
     def responses(self):
         """Return responses."""
-        _responses = []
-
-        for item in RESPONSE_ITER_REGEX.finditer(self.doc):
-            response = item.groupdict()
-            response["schema"] = response.get("schema", {})
-            _responses.append(response)
-
-        return _responses
+        return [
+            {"code": m["code"], "schema": m["schema"], "description": m["description"]}
+            for m in RESPONSE_ITER_REGEX.finditer(self.doc)
+        ]
 
     @property
     def content(self):
@@ -153,7 +153,7 @@ class SphinxParser:
             return ["json"]
 
         parsed = m.group(1).strip("[]") or "json"
-        return re.split(r",\s*|\s+", parsed)
+        return LIST_SPLIT_REGEX.split(parsed)
 
     @staticmethod
     def generate_operation_id(method):
@@ -177,17 +177,9 @@ class SphinxParser:
         :param method method:    Python method
         :return dict:            Dict of parameter options
         """
-        m = re.search(OPERATION_REGEX, method.__qualname__)
-        if m:
-            return m.group(1)
-
-        return None
-
-    @staticmethod
-    def _parse_suffix(method):
-        m = re.search(SUFFIX_REGEX, method.__qualname__)
+        m = OPERATION_SUFFIX_REGEX.search(method.__qualname__)
         if m:
-            return m.group(1)
+            return m.group("operation")
 
         return None
 
@@ -201,9 +193,13 @@ class SphinxParser:
         :return dict:             Return operation dictionary
         """
         self.doc = inspect.cleandoc(method.__doc__)
-        operation = operation or self.parse_operation(method)
         operation_id = operation_id or self.generate_operation_id(method)
-        suffix = self._parse_suffix(method)
+        suffix = None
+
+        # parse operation and suffix from the method name in one search
+        if m := OPERATION_SUFFIX_REGEX.search(method.__qualname__):
+            operation = operation or m.group("operation")
+            suffix = m.group("suffix")
 
         return {
             "operation": operation,
@@ -7,10 +7,12 @@ Copyright 2016-2024.
 
 def http(code):
     """Return HTTP as string."""
+    code = str(code)
+
     try:
-        return f"{int(code)} {CODES[str(code)]}"
-    except ValueError:
-        return f"{MESSAGES[code.upper()]} {code}"
+        return STATUSES[code]
+    except KeyError:
+        return STATUSES[MESSAGES[code.upper()]]
 
 
 HTTP = http
@@ -74,4 +76,7 @@ CODES = {
     "511": "Network Authentication Required",
 }
 
-MESSAGES = {(v.upper().replace(" ", "_"), k) for k, v in CODES.items()}
+MESSAGES = {v.upper().replace(" ", "_"): k for k, v in CODES.items()}
+
+# status lines are formatted once, ex: "404 Not Found"
+STATUSES = {k: f"{k} {v}" for k, v in CODES.items()}
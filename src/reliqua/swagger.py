@@ -4,11 +4,46 @@ Reliqua framework.
 Copyright 2016-2024.
 """
 
-from reliqua.resources.base import Resource
+import gzip
+import hashlib
+
+from reliqua.resources.base import Resource, not_modified
 
 from .status_codes import HTTP
 
 
+def accepts_gzip(header):
+    """
+    Return whether the Accept-Encoding header allows gzip.
+
+    Each coding is checked with its q-value, so a coding listed with
+    ``q=0`` is refused. An explicit gzip entry takes precedence over ``*``.
+
+    :param str header:    Accept-Encoding header value
+    :return bool:         True if gzip is acceptable
+    """
+    qvalues = {}
+
+    for item in (header or "").split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "*"):
+            continue
+
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+
+        qvalues[coding] = q
+
+    return qvalues.get("gzip", qvalues.get("*", 0.0)) > 0
+
+
 def index(spec, server, sort="alpha", highlight="true"):
     """
     Return the Swagger index HTML.
@@ -80,7 +115,14 @@ class Swagger(Resource):
         self.highlight = highlight
         self.sort = sort
 
-    def on_get(self, _req, resp):
+        # the page only depends on the constructor arguments, render it once
+        self.status = HTTP(200)
+        self.data = index(openapi_url, url, sort=sort, highlight=highlight).encode("utf-8")
+        self.etag = hashlib.blake2b(self.data, digest_size=8).hexdigest()
+        self.gzip_data = gzip.compress(self.data, compresslevel=9)
+        self.gzip_etag = f"{self.etag}-gzip"
+
+    def on_get(self, req, resp):
         """
         Return the static swagger file.
 
@@ -89,6 +131,17 @@ class Swagger(Resource):
         :param str filename:        Filename contents to return
         :return text:               File contents
         """
-        resp.status = HTTP(200)
+        compress = accepts_gzip(req.get_header("Accept-Encoding"))
+        resp.vary = ("Accept-Encoding",)
+
+        if not_modified(req, resp, self.gzip_etag if compress else self.etag):
+            return
+
+        resp.status = self.status
         resp.content_type = "text/html"
-        resp.text = index(self.openapi_url, self.url, sort=self.sort, highlight=self.highlight)
+
+        if compress:
+            resp.set_header("Content-Encoding", "gzip")
+            resp.data = self.gzip_data
+        else:
+            resp.data = self.data
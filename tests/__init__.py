@@ -0,0 +1,5 @@
+"""
+Reliqua Framework.
+
+Copyright 2016-2024.
+"""
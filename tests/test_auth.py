@@ -0,0 +1,92 @@
+"""
+Reliqua Framework.
+
+Copyright 2016-2024.
+"""
+
+from base64 import b64encode
+
+import falcon
+import falcon.testing
+import pytest
+
+from reliqua.auth import AccessMap, AccessResource, BasicAuthentication
+
+
+class Users:
+    """Resource with role based access."""
+
+    name = "Users"
+    __auth__ = {"GET": ["admin", "user"], "post": "admin"}
+
+
+def test_access_map_string_role():
+    """A single role given as a string is matched whole, not by character."""
+    access = AccessMap({"/users": {"GET": "admin"}})
+
+    assert access.authorized("admin", "/users", "GET", None)
+    assert not access.authorized("a", "/users", "GET", None)
+
+
+def test_access_resource_string_role():
+    """A single resource role given as a string is matched whole."""
+    access = AccessResource()
+
+    assert access.authorized("admin", "/users", "POST", Users())
+    assert not access.authorized("a", "/users", "POST", Users())
+
+
+def test_access_map_case_insensitive():
+    """Routes and methods match regardless of case."""
+    access = AccessMap({"/Users": {"get": ["admin"]}, "/open": {"*": ["*"]}})
+
+    assert access.authorized("admin", "/users", "GET", None)
+    assert not access.authorized("user", "/users", "GET", None)
+    assert access.authentication_required("/USERS", "GET", None)
+    assert not access.authentication_required("/open", "POST", None)
+
+
+def test_access_map_unknown_route():
+    """Routes missing from the map are denied and require authentication."""
+    access = AccessMap({"/users": {"GET": ["admin"]}})
+
+    assert not access.authorized("admin", "/servers", "GET", None)
+    assert access.authentication_required("/servers", "GET", None)
+
+
+def test_access_resource_case_insensitive():
+    """Resource auth methods match regardless of case."""
+    access = AccessResource()
+
+    assert access.authorized("user", "/users", "get", Users())
+    assert not access.authorized("guest", "/users", "GET", Users())
+    assert access.authentication_required("/users", "POST", Users())
+
+
+def test_access_resource_undefined_method():
+    """Undefined methods are allowed, and only require authentication in deny mode."""
+    assert AccessResource().authorized("guest", "/users", "DELETE", Users())
+    assert AccessResource(default_mode="deny").authentication_required("/users", "DELETE", Users())
+    assert not AccessResource(default_mode="allow").authentication_required("/users", "DELETE", Users())
+
+
+def basic_request(token):
+    """Return a request with a Basic authorization token."""
+    return falcon.testing.create_req(headers={"Authorization": f"Basic {token}"})
+
+
+def test_basic_credentials():
+    """Valid Basic credentials are decoded and passed to the validation callback."""
+    auth = BasicAuthentication(validation=lambda username, password: password == "s:cret" and username)
+    token = b64encode(b"ted:s:cret").decode()
+
+    assert auth.authenticate(basic_request(token), None, None) == "ted"
+
+
+@pytest.mark.parametrize("token", ["dGV", "dG=k", "/w=="])
+def test_basic_invalid_token(token):
+    """Tokens that are not padded base64 of UTF-8 text are unauthorized."""
+    auth = BasicAuthentication(validation=lambda username, _password: username)
+
+    with pytest.raises(falcon.HTTPUnauthorized):
+        auth.authenticate(basic_request(token), None, None)
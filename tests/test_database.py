@@ -0,0 +1,23 @@
+"""
+Reliqua Framework.
+
+Copyright 2016-2024.
+"""
+
+import pytest
+
+pytest.importorskip("peewee")
+
+from reliqua.database import is_b64
+
+
+@pytest.mark.parametrize("value", [b"YWJj", b"aGVsbG8="])
+def test_is_b64(value):
+    """Padded base64 bytes are recognized."""
+    assert is_b64(value)
+
+
+@pytest.mark.parametrize("value", [b"YWJ", b"YW Jj", b"@@@@", "YWJj", None])
+def test_is_not_b64(value):
+    """Malformed values, and anything that is not bytes, are rejected."""
+    assert not is_b64(value)
@@ -0,0 +1,37 @@
+"""
+Reliqua Framework.
+
+Copyright 2016-2024.
+"""
+
+import falcon
+import falcon.testing
+
+from reliqua.docs import Docs
+
+
+def client():
+    """Return a test client serving a schema."""
+    app = falcon.App()
+    app.add_route("/openapi.json", Docs({"openapi": "3.1.0", "paths": {}}))
+    return falcon.testing.TestClient(app)
+
+
+def test_schema_etag():
+    """The schema is served as JSON with an ETag."""
+    result = client().simulate_get("/openapi.json")
+
+    assert result.status == falcon.HTTP_200
+    assert result.json == {"openapi": "3.1.0", "paths": {}}
+    assert result.headers["ETag"]
+
+
+def test_schema_not_modified():
+    """A matching If-None-Match returns 304 without a body, anything else the schema."""
+    etag = client().simulate_get("/openapi.json").headers["ETag"]
+
+    result = client().simulate_get("/openapi.json", headers={"If-None-Match": etag})
+
+    assert result.status == falcon.HTTP_304
+    assert not result.content
+    assert client().simulate_get("/openapi.json", headers={"If-None-Match": '"other"'}).status == falcon.HTTP_200
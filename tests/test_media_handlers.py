@@ -0,0 +1,42 @@
+"""
+Reliqua Framework.
+
+Copyright 2016-2024.
+"""
+
+import json
+from datetime import datetime, timezone
+from enum import Enum
+
+from reliqua.media_handlers import JSONHandler, TextHandler
+
+
+class Color(str, Enum):
+    """String enum."""
+
+    RED = "red"
+
+
+def test_json_dates():
+    """Dates are serialized with their str() form."""
+    value = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    assert json.loads(JSONHandler().serialize({"created": value}, None)) == {"created": str(value)}
+
+
+def test_json_wide_integers():
+    """Integers wider than 64 bits are serialized instead of failing."""
+    value = 2**70
+
+    assert json.loads(JSONHandler().serialize({"value": value}, None)) == {"value": value}
+
+
+def test_text_strings():
+    """Strings are encoded as UTF-8 and other values are formatted first."""
+    assert TextHandler().serialize("h\u00e9", None) == "h\u00e9".encode()
+    assert TextHandler().serialize(42, None) == b"42"
+
+
+def test_text_str_subclass():
+    """String subclasses are formatted, as before, rather than encoded directly."""
+    assert TextHandler().serialize(Color.RED, None) == f"{Color.RED}".encode()
@@ -0,0 +1,131 @@
+"""
+Reliqua Framework.
+
+Copyright 2016-2024.
+"""
+
+import falcon
+import falcon.testing
+
+from reliqua.middleware import Parameter, ProcessParams, to_bool
+
+
+class Echo:
+    """Resource returning the processed parameters."""
+
+    __has_params__ = True
+
+    def __init__(self, *parameters):
+        """Create a resource documenting the given parameters for GET and POST."""
+        parameters = tuple(Parameter(**x) for x in parameters)
+        self.__params__ = {("/echo", "get"): parameters, ("/echo", "post"): parameters}
+
+    def on_get(self, req, resp):
+        """Return the parameters."""
+        resp.media = {k: v for k, v in req.params.items() if k != "operators"}
+
+    on_post = on_get
+
+
+def client(*parameters, handlers=None):
+    """Return a test client for a resource with the given parameters."""
+    app = falcon.App(middleware=[ProcessParams()])
+    app.req_options.media_handlers.update(handlers or {})
+    app.add_route("/echo", Echo(*parameters))
+    return falcon.testing.TestClient(app)
+
+
+def test_object_missing_uses_default():
+    """An optional object parameter missing from the request falls back to its default."""
+    for datatype in ("dict", "json", "object"):
+        result = client({"name": "config", "datatype": datatype, "default": "{}"}).simulate_get("/echo")
+
+        assert result.status == falcon.HTTP_200
+        assert result.json == {"config": "{}"}
+
+
+def test_object_from_query():
+    """An object parameter is parsed from JSON in the query string."""
+    result = client({"name": "config", "datatype": "dict"}).simulate_get("/echo", params={"config": '{"a": 1}'})
+
+    assert result.json == {"config": {"a": 1}}
+
+
+def test_body_parsed_by_registered_handler():
+    """Bodies are parsed by the handler registered for their content type."""
+    handlers = {"application/vnd.api+json": falcon.media.JSONHandler()}
+    result = client({"name": "name", "datatype": "str"}, handlers=handlers).simulate_post(
+        "/echo", body='{"name": "ted"}', headers={"Content-Type": "application/vnd.api+json"}
+    )
+
+    assert result.json == {"name": "ted"}
+
+
+def test_unsupported_body_is_rejected():
+    """A body without a registered handler is rejected rather than ignored."""
+    result = client({"name": "name", "datatype": "str", "required": True}).simulate_post(
+        "/echo", body="name: ted", headers={"Content-Type": "application/x-yaml"}
+    )
+
+    assert result.status == falcon.HTTP_415
+
+
+def test_list_default_is_a_list():
+    """A missing list parameter returns its default split and transformed as a list."""
+    result = client({"name": "ids", "datatype": "list[int]", "default": "5"}).simulate_get("/echo")
+
+    assert result.json == {"ids": [5]}
+
+    result = client({"name": "ids", "datatype": "list[int]", "default": "1, 2"}).simulate_get("/echo")
+
+    assert result.json == {"ids": [1, 2]}
+
+
+def test_list_split_and_transform():
+    """Comma separated values are split, stripped, emptied items dropped and transformed."""
+    result = client({"name": "ids", "datatype": "list[int]"}).simulate_get("/echo", query_string="ids=1,%202,,3")
+
+    assert result.json == {"ids": [1, 2, 3]}
+
+    result = client({"name": "ids", "datatype": "list[int]"}).simulate_get("/echo", query_string="ids=1,x")
+
+    assert result.status == falcon.HTTP_400
+
+
+def test_list_keeps_falsy_json_items():
+    """Falsy items in a JSON list body are kept as strings, only empty strings are dropped."""
+    result = client({"name": "flags", "datatype": "list"}).simulate_post("/echo", json={"flags": [0, False, "", "a"]})
+
+    assert result.json == {"flags": ["0", "False", "a"]}
+
+
+def test_to_bool():
+    """Recognized strings convert case-insensitively, anything else is None."""
+    assert to_bool("Yes") is True
+    assert to_bool("OFF") is False
+    assert to_bool(True) is True
+    assert to_bool("maybe") is None
+
+
+def test_bool_query_values():
+    """Boolean query values are converted, blanks are true and invalid values rejected."""
+    parameter = {"name": "flag", "datatype": "bool"}
+
+    assert client(parameter).simulate_get("/echo", query_string="flag=off").json == {"flag": False}
+    assert client(parameter).simulate_get("/echo", query_string="flag=").json == {"flag": True}
+    assert client(parameter).simulate_get("/echo", query_string="flag=maybe").status == falcon.HTTP_400
+
+
+def test_bool_json_value():
+    """Booleans from a JSON body are kept as is."""
+    result = client({"name": "flag", "datatype": "bool"}).simulate_post("/echo", json={"flag": False})
+
+    assert result.json == {"flag": False}
+
+
+def test_required_falsy_json_value_is_present():
+    """A required parameter with a falsy JSON value counts as present."""
+    parameter = {"name": "count", "datatype": "int", "required": True}
+
+    assert client(parameter).simulate_post("/echo", json={"count": 0}).json == {"count": 0}
+    assert client(parameter).simulate_post("/echo", json={}).status == falcon.HTTP_400
@@ -0,0 +1,56 @@
+"""
+Reliqua Framework.
+
+Copyright 2016-2024.
+"""
+
+import falcon
+import falcon.testing
+
+from reliqua.swagger import Swagger, accepts_gzip
+
+
+def client():
+    """Return a test client serving the Swagger index."""
+    app = falcon.App()
+    app.add_route("/docs", Swagger("http://localhost/swagger", "http://localhost/openapi/openapi.json"))
+    return falcon.testing.TestClient(app)
+
+
+def test_accepts_gzip():
+    """Gzip is acceptable when listed, or matched by a wildcard, with q > 0."""
+    assert accepts_gzip("gzip")
+    assert accepts_gzip("deflate, gzip;q=0.5")
+    assert accepts_gzip("*")
+    assert not accepts_gzip(None)
+    assert not accepts_gzip("deflate")
+    assert not accepts_gzip("gzip;q=0, identity")
+    assert not accepts_gzip("*, gzip;q=0")
+    assert not accepts_gzip("*;q=0")
+
+
+def test_gzip_response():
+    """The index is compressed when the client accepts gzip."""
+    result = client().simulate_get("/docs", headers={"Accept-Encoding": "gzip"})
+
+    assert result.status == falcon.HTTP_200
+    assert result.headers["Content-Encoding"] == "gzip"
+
+
+def test_gzip_refused():
+    """The index is not compressed when the client refuses gzip with q=0."""
+    result = client().simulate_get("/docs", headers={"Accept-Encoding": "gzip;q=0, identity"})
+
+    assert result.status == falcon.HTTP_200
+    assert "Content-Encoding" not in result.headers
+    assert result.text.lstrip().startswith("<!-- HTML")
+
+
+def test_not_modified():
+    """A matching If-None-Match returns 304, and compressed and plain copies have distinct tags."""
+    plain = client().simulate_get("/docs").headers["ETag"]
+    gzipped = client().simulate_get("/docs", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+
+    assert plain != gzipped
+    assert client().simulate_get("/docs", headers={"If-None-Match": plain}).status == falcon.HTTP_304
+    assert client().simulate_get("/docs", headers={"If-None-Match": gzipped}).status == falcon.HTTP_200